@@ -25,6 +25,7 @@ def scrape(
     show_results: bool = typer.Option(True, "--show/--no-show", help="Show results in console"),
 ):
     """Scrape messages from Slack channel and process them."""
+    agent = None
     try:
         agent = SlackMessageAgent()
         
@@ -42,6 +43,9 @@ def scrape(
     except Exception as e:
         rprint(f"[bold red]❌ Error: {e}[/bold red]")
         raise typer.Exit(1)
+    finally:
+        if agent is not None:
+            agent.close()
 
 
 @app.command()
@@ -49,6 +53,7 @@ def users(
     limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Maximum number of messages to scan")
 ):
     """List users who have posted in the channel."""
+    agent = None
     try:
         agent = SlackMessageAgent()
         
@@ -78,11 +83,15 @@ def users(
     except Exception as e:
         rprint(f"[bold red]❌ Error: {e}[/bold red]")
         raise typer.Exit(1)
+    finally:
+        if agent is not None:
+            agent.close()
 
 
 @app.command()
 def test():
     """Test connections to Slack and OpenAI APIs."""
+    agent = None
     try:
         settings = get_settings()
         agent = SlackMessageAgent(settings)
@@ -98,12 +107,12 @@ def test():
         
         # Test OpenAI by processing a simple message
         from src.models import SlackMessage
-        from datetime import datetime
+        import time
         
         test_message = SlackMessage(
             user_id="test_user",
             username="test_user",
-            timestamp=datetime.now(),
+            ts_raw=str(time.time()),
             text="I completed the project setup yesterday. Next, I need to implement the API endpoints.",
             channel_id="test_channel"
         )
@@ -122,6 +131,9 @@ def test():
     except Exception as e:
         rprint(f"[bold red]❌ Error: {e}[/bold red]")
         raise typer.Exit(1)
+    finally:
+        if agent is not None:
+            agent.close()
 
 
 @app.command()
@@ -1,4 +1,5 @@
 from typing import List, Optional
+from collections import Counter
 import logging
 from datetime import datetime
 from src.config import Settings, get_settings
@@ -20,6 +21,16 @@ class SlackMessageAgent:
         self.message_processor = MessageProcessor(self.settings)
         self.output_manager = OutputManager()
     
+    def close(self):
+        """Release the OpenAI connection pools and response cache held by the processor."""
+        self.message_processor.close()
+    
+    def __enter__(self) -> 'SlackMessageAgent':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     def _setup_logging(self) -> logging.Logger:
         """Set up logging configuration."""
         logging.basicConfig(
@@ -41,11 +52,7 @@ class SlackMessageAgent:
         """
         self.logger.info("Starting Slack message scraping and processing")
         
-        # Test connections
-        if not self.slack_scraper.test_connection():
-            raise RuntimeError("Failed to connect to Slack API")
-        
-        # Scrape messages
+        # Scrape messages (auth problems surface as SlackApiError from the first call)
         if user_id:
             messages = self.slack_scraper.get_user_messages(user_id, limit)
         else:
@@ -115,18 +122,13 @@ class SlackMessageAgent:
             List of user information dictionaries
         """
         messages = self.slack_scraper.get_channel_messages()
-        users = {}
-        
-        for message in messages:
-            if message.user_id not in users:
-                users[message.user_id] = {
-                    'user_id': message.user_id,
-                    'username': message.username,
-                    'message_count': 0
-                }
-            users[message.user_id]['message_count'] += 1
-        
-        return list(users.values())
+        counts = Counter(message.user_id for message in messages)
+        usernames = {message.user_id: message.username for message in messages}
+        
+        return [
+            {'user_id': user_id, 'username': usernames[user_id], 'message_count': count}
+            for user_id, count in counts.items()
+        ]
     
     def process_specific_user(self, user_id: str, limit: Optional[int] = None) -> ProcessingResult:
         """
@@ -1,40 +1,76 @@
-import os
-from typing import Optional
-from pydantic import BaseModel
-from dotenv import load_dotenv
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from pydantic import ValidationError, ValidationInfo, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-class Settings:
-    """Application settings loaded from environment variables."""
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class Settings(BaseSettings):
+    """Application settings loaded from environment variables and the project .env file."""
+    
+    model_config = SettingsConfigDict(
+        env_file=_PROJECT_ROOT / '.env',
+        env_file_encoding='utf-8',
+        extra='ignore',
+        frozen=True,
+        validate_default=True
+    )
+    
+    # Slack Configuration
+    slack_bot_token: str = ''
+    slack_channel_id: str = ''
     
-    def __init__(self):
-        load_dotenv()
-        
-        # Slack Configuration
-        self.slack_bot_token: str = os.getenv('SLACK_BOT_TOKEN', '')
-        self.slack_channel_id: str = os.getenv('SLACK_CHANNEL_ID', '')
-        
-        # OpenAI Configuration
-        self.openai_api_key: str = os.getenv('OPENAI_API_KEY', '')
-        self.openai_model: str = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
-        
-        # Application Settings
-        self.log_level: str = os.getenv('LOG_LEVEL', 'INFO')
-        self.output_format: str = os.getenv('OUTPUT_FORMAT', 'json')
-        max_messages_raw = os.getenv('MAX_MESSAGES', '100')
-        # Remove inline comments and whitespace
-        max_messages_clean = max_messages_raw.split('#')[0].strip()
-        self.max_messages: int = int(max_messages_clean)
-        
-        # Validate required settings
-        if not self.slack_bot_token:
-            raise ValueError("SLACK_BOT_TOKEN environment variable is required")
-        if not self.slack_channel_id:
-            raise ValueError("SLACK_CHANNEL_ID environment variable is required")
-        if not self.openai_api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is required")
+    # OpenAI Configuration
+    openai_api_key: str = ''
+    openai_model: str = 'gpt-3.5-turbo'
+    openai_classifier_model: str = ''
+    openai_batch_size: int = 10
+    openai_max_concurrency: int = 20
+    openai_max_retries: int = 3
+    message_prefilter: bool = True
+    
+    # Application Settings
+    log_level: str = 'INFO'
+    output_format: str = 'json'
+    max_messages: int = 100
+    llm_cache_dir: str = str(_PROJECT_ROOT / '.llm_cache')
+    
+    @field_validator('max_messages', 'openai_batch_size', 'openai_max_concurrency', 'openai_max_retries',
+                     'message_prefilter', mode='before')
+    @classmethod
+    def _strip_inline_comment(cls, value: Any) -> Any:
+        """Remove inline comments and whitespace from numeric and boolean values."""
+        if isinstance(value, str):
+            return value.split('#')[0].strip()
+        return value
+    
+    @field_validator('slack_bot_token', 'slack_channel_id', 'openai_api_key')
+    @classmethod
+    def _require_value(cls, value: str, info: ValidationInfo) -> str:
+        """Validate required settings."""
+        if not value:
+            raise ValueError(f"{info.field_name.upper()} environment variable is required")
+        return value
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
-    return Settings()
+    """
+    Get application settings, built once per process.
+    
+    Raises:
+        ValueError: With a one-line message for the first invalid or missing setting
+    """
+    try:
+        return Settings()
+    except ValidationError as e:
+        error = e.errors()[0]
+        if error['type'] == 'value_error':
+            # Raised by our own validators, whose messages already name the variable
+            message = str(error['ctx']['error'])
+        else:
+            message = f"{str(error['loc'][0]).upper()}: {error['msg']}"
+        raise ValueError(message) from None
@@ -1,20 +1,122 @@
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime
+from itertools import islice
+import asyncio
+import hashlib
 import logging
-import json
+import re
+import diskcache
+import httpx
 import openai
+import orjson
 from src.models import SlackMessage
 from src.config import Settings
 
 
+Extraction = Tuple[Optional[str], Optional[str], float]
+
+# Bump SYSTEM_PROMPT_VERSION whenever SYSTEM_PROMPT or BATCH_SYSTEM_PROMPT changes so cached
+# extractions are invalidated
+SYSTEM_PROMPT_VERSION = 2
+SYSTEM_PROMPT = """You are an expert at analyzing workplace communication messages to extract progress updates and next steps. 
+
+Your task is to:
+1. Identify any progress or accomplishments mentioned in the message
+2. Identify any next steps, plans, or future actions mentioned
+3. Provide a confidence score (0-1) for your extraction
+
+Return your response in the following JSON format:
+{
+    "progress": "extracted progress information or null if none found",
+    "next_steps": "extracted next steps information or null if none found",
+    "confidence": 0.85
+}
+
+Be concise and focus on the key information. If no clear progress or next steps are mentioned, return null for those fields."""
+
+# Batched requests get their own system prompt so the output contract matches _parse_batch_result
+BATCH_SYSTEM_PROMPT = """You are an expert at analyzing workplace communication messages to extract progress updates and next steps.
+
+You will receive a numbered list of messages. For each message:
+1. Identify any progress or accomplishments mentioned in the message
+2. Identify any next steps, plans, or future actions mentioned
+3. Provide a confidence score (0-1) for your extraction
+
+Return your response as a single JSON object with a "results" array holding exactly one entry per message, using the message number as "id":
+{
+    "results": [
+        {"id": 1, "progress": "extracted progress information or null if none found", "next_steps": "extracted next steps information or null if none found", "confidence": 0.85},
+        ...
+    ]
+}
+
+Be concise and focus on the key information. If no clear progress or next steps are mentioned in a message, return null for those fields."""
+
+_CODE_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*(.*?)\s*```\s*$', re.DOTALL)
+
+# Messages with none of these words (or shorter than _MIN_SIGNAL_LENGTH) are
+# assumed to carry no progress or next steps and never reach OpenAI, unless
+# MESSAGE_PREFILTER is turned off
+_SIGNAL_RE = re.compile(
+    r'\b(done|finish(?:ed)?|complete(?:d)?|shipped|deployed|merged|fixed|implemented|added|wrote'
+    r'|released|reviewed|tested|updated|next|plan(?:ned|ning)?|will'
+    r'|tomorrow|today|blocker|blocked|stuck|progress|start(?:ed)?|working)\b',
+    re.IGNORECASE
+)
+_MIN_SIGNAL_LENGTH = 15
+
+# Batched yes/no prompt for the cheap first-stage model; only "yes" messages reach the extractor.
+# Bump CLASSIFIER_PROMPT_VERSION whenever CLASSIFIER_PROMPT changes so cached rejections are invalidated
+CLASSIFIER_PROMPT_VERSION = 1
+CLASSIFIER_PROMPT = """You screen workplace chat messages before a more detailed analysis.
+
+You will receive a numbered list of messages. For each message, decide whether it mentions any progress, accomplishment, next step, or plan.
+
+Return your response as a single JSON object with a "results" array holding exactly one entry per message, using the message number as "id" and "yes" or "no" as "answer":
+{
+    "results": [
+        {"id": 1, "answer": "yes"},
+        ...
+    ]
+}"""
+
+# Applied to messages with nothing to extract; also the failure result, so it is never cached
+_NO_EXTRACTION: Extraction = (None, None, 0.0)
+
+
 class MessageProcessor:
     """Handles OpenAI API interactions to extract progress and next steps."""
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        openai.api_key = settings.openai_api_key  # Set the API key globally
+        # Pooled clients live as long as the processor, so connections are reused across
+        # calls and runs; release them with close()
+        self.client = openai.OpenAI(
+            api_key=settings.openai_api_key,
+            max_retries=settings.openai_max_retries,
+            http_client=httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+            )
+        )
+        # Async connection pools are bound to one event loop, so every run uses this loop
+        self._loop = asyncio.new_event_loop()
+        self._async_client: Optional[openai.AsyncOpenAI] = None
+        # Models that answered a JSON-mode request with a 400; they are sent plain requests
+        self._no_json_mode: Set[str] = set()
+        self.cache = diskcache.Cache(settings.llm_cache_dir)
         self.logger = logging.getLogger(__name__)
     
+    def close(self):
+        """Close the pooled HTTP clients, the event loop, and the response cache."""
+        if self._async_client is not None:
+            self._loop.run_until_complete(self._async_client.close())
+            self._async_client = None
+        if not self._loop.is_closed():
+            self._loop.close()
+        self.client.close()
+        self.cache.close()
+    
     def process_message(self, message: SlackMessage) -> SlackMessage:
         """
         Process a single message to extract progress and next steps.
@@ -25,22 +127,20 @@ class MessageProcessor:
         Returns:
             Updated SlackMessage with progress and next_steps populated
         """
+        if not self._has_signal(message.text):
+            self.logger.debug(f"Skipped message from {message.username} with no progress or next-step keywords")
+            self._apply_extraction(message, None, None, 0.0)
+            return message
+        
         try:
             progress, next_steps, confidence = self._extract_progress_and_next_steps(message.text)
-            
-            message.progress = progress
-            message.next_steps = next_steps
-            message.confidence_score = confidence
-            message.processed_at = datetime.now()
+            self._apply_extraction(message, progress, next_steps, confidence)
             
             self.logger.debug(f"Processed message from {message.username}")
             
         except Exception as e:
             self.logger.error(f"Error processing message from {message.username}: {e}")
-            message.progress = None
-            message.next_steps = None
-            message.confidence_score = 0.0
-            message.processed_at = datetime.now()
+            self._apply_extraction(message, None, None, 0.0)
         
         return message
     
@@ -48,22 +148,216 @@ class MessageProcessor:
         """
         Process multiple messages to extract progress and next steps.
         
+        Messages with identical text are extracted once and the result is shared.
+        Messages are sent to OpenAI in batches of ``openai_batch_size``, and up to
+        ``openai_max_concurrency`` requests are in flight at once.
+        
         Args:
             messages: List of SlackMessage objects to process
             
+        Returns:
+            List of updated SlackMessage objects, in the same order as given
+        """
+        if not messages:
+            return []
+        
+        groups: Dict[str, List[SlackMessage]] = {}
+        for message in messages:
+            groups.setdefault(message.text, []).append(message)
+        
+        unique = [group[0] for group in groups.values()]
+        if len(unique) < len(messages):
+            self.logger.info(f"Deduplicated {len(messages)} messages to {len(unique)} unique texts")
+        
+        self._loop.run_until_complete(self._gather(unique))
+        
+        for first, *duplicates in groups.values():
+            for duplicate in duplicates:
+                self._apply_extraction(duplicate, first.progress, first.next_steps, first.confidence_score)
+        
+        return messages
+    
+    async def _gather(self, messages: List[SlackMessage]) -> List[SlackMessage]:
+        """Dispatch every batch concurrently, bounded by a semaphore."""
+        pending = []
+        skipped = 0
+        for message in messages:
+            if not self._has_signal(message.text):
+                self.logger.debug(f"Skipped message from {message.username} with no progress or next-step keywords")
+                self._apply_extraction(message, None, None, 0.0)
+                skipped += 1
+                continue
+            
+            cached = self.cache.get(self._cache_key(message.text))
+            if cached is not None:
+                self._apply_extraction(message, *cached)
+            else:
+                pending.append(message)
+        
+        if skipped:
+            self.logger.info(f"Skipped {skipped} messages with no progress or next-step keywords")
+        if len(pending) < len(messages) - skipped:
+            self.logger.info(f"Reused cached results for {len(messages) - skipped - len(pending)} messages")
+        
+        client = self._get_async_client()
+        semaphore = asyncio.Semaphore(max(1, self.settings.openai_max_concurrency))
+        
+        if self.settings.openai_classifier_model:
+            rejected = 0
+            unscreened = []
+            for message in pending:
+                if self._is_cached_rejection(message.text):
+                    self._apply_extraction(message, *_NO_EXTRACTION)
+                    rejected += 1
+                else:
+                    unscreened.append(message)
+            pending = unscreened
+            
+            # Each batch is screened and then extracted within one task, so a batch starts
+            # extracting as soon as its own screening returns
+            batches = self._chunk(pending)
+            batch_rejections = await asyncio.gather(
+                *(self._ascreen_and_process_batch(client, semaphore, batch) for batch in batches)
+            )
+            rejected += sum(batch_rejections)
+            if rejected:
+                self.logger.info(f"Classifier found nothing to extract in {rejected} messages")
+        else:
+            batches = self._chunk(pending)
+            await asyncio.gather(
+                *(self._aprocess_batch(client, semaphore, batch) for batch in batches)
+            )
+        
+        # Messages are updated in place, so the input order is preserved
+        self.logger.info(f"Processed {len(pending)} messages in {len(batches)} batches")
+        return messages
+    
+    def _chunk(self, messages: List[SlackMessage]) -> List[List[SlackMessage]]:
+        """Split messages into lists of at most ``openai_batch_size``."""
+        batch_size = max(1, self.settings.openai_batch_size)
+        iterator = iter(messages)
+        batches = []
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            batches.append(batch)
+        return batches
+    
+    def _get_async_client(self) -> openai.AsyncOpenAI:
+        """Return the processor's pooled async client, creating it on first use."""
+        if self._async_client is None:
+            concurrency = max(1, self.settings.openai_max_concurrency)
+            self._async_client = openai.AsyncOpenAI(
+                api_key=self.settings.openai_api_key,
+                max_retries=self.settings.openai_max_retries,
+                http_client=httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+                )
+            )
+        return self._async_client
+    
+    async def _aprocess(self, client: openai.AsyncOpenAI, semaphore: asyncio.Semaphore,
+                        message: SlackMessage) -> SlackMessage:
+        """Async counterpart of process_message."""
+        async with semaphore:
+            try:
+                progress, next_steps, confidence = await self._aextract_progress_and_next_steps(client, message.text)
+                self._apply_extraction(message, progress, next_steps, confidence)
+                
+                self.logger.debug(f"Processed message from {message.username}")
+                
+            except Exception as e:
+                self.logger.error(f"Error processing message from {message.username}: {e}")
+                self._apply_extraction(message, None, None, 0.0)
+        
+        return message
+    
+    async def _aprocess_batch(self, client: openai.AsyncOpenAI, semaphore: asyncio.Semaphore,
+                              batch: List[SlackMessage]) -> List[SlackMessage]:
+        """
+        Process a batch of messages with a single OpenAI call.
+        
+        Falls back to per-message calls if the batched response cannot be parsed,
+        and for any message missing from an otherwise valid response.
+        
+        Args:
+            client: Pooled async OpenAI client
+            semaphore: Semaphore bounding the number of in-flight requests
+            batch: List of SlackMessage objects to process together
+            
         Returns:
             List of updated SlackMessage objects
         """
-        processed_messages = []
+        if len(batch) == 1:
+            return [await self._aprocess(client, semaphore, batch[0])]
         
-        for i, message in enumerate(messages):
-            self.logger.info(f"Processing message {i+1}/{len(messages)} from {message.username}")
-            processed_message = self.process_message(message)
-            processed_messages.append(processed_message)
+        async with semaphore:
+            self.logger.info(f"Processing batch of {len(batch)} messages")
+            results = await self._aextract_batch(client, batch)
         
-        return processed_messages
+        if results is None:
+            self.logger.warning(f"Batch extraction failed, falling back to per-message processing for {len(batch)} messages")
+            return list(await asyncio.gather(*(self._aprocess(client, semaphore, message) for message in batch)))
+        
+        missing = []
+        for i, message in enumerate(batch, 1):
+            if i not in results:
+                missing.append(message)
+                continue
+            
+            self._apply_extraction(message, *results[i])
+            self._cache_store(message.text, results[i])
+            self.logger.debug(f"Processed message from {message.username}")
+        
+        if missing:
+            self.logger.debug(f"{len(missing)} messages missing from batch response, processing individually")
+            await asyncio.gather(*(self._aprocess(client, semaphore, message) for message in missing))
+        
+        return batch
+    
+    async def _ascreen_and_process_batch(self, client: openai.AsyncOpenAI, semaphore: asyncio.Semaphore,
+                                         batch: List[SlackMessage]) -> int:
+        """
+        Screen a batch with the classifier, then extract the messages it lets through.
+        
+        Args:
+            client: Pooled async OpenAI client
+            semaphore: Semaphore bounding the number of in-flight requests
+            batch: List of SlackMessage objects to screen and process
+            
+        Returns:
+            Number of messages the classifier rejected
+        """
+        flags = await self._aclassify_batch(client, semaphore, batch)
+        survivors = []
+        for message, flag in zip(batch, flags):
+            if flag:
+                survivors.append(message)
+            else:
+                self._apply_extraction(message, *_NO_EXTRACTION)
+                self._cache_rejection(message.text)
+        
+        if survivors:
+            await self._aprocess_batch(client, semaphore, survivors)
+        return len(batch) - len(survivors)
     
-    def _extract_progress_and_next_steps(self, text: str) -> Tuple[Optional[str], Optional[str], float]:
+    def _has_signal(self, text: str) -> bool:
+        """Cheap keyword check for whether a message is worth sending to OpenAI."""
+        if not self.settings.message_prefilter:
+            return True
+        return len(text) >= _MIN_SIGNAL_LENGTH and _SIGNAL_RE.search(text) is not None
+    
+    def _apply_extraction(self, message: SlackMessage, progress: Optional[str],
+                          next_steps: Optional[str], confidence: float):
+        """Store an extraction result on a message."""
+        message.progress = progress
+        message.next_steps = next_steps
+        message.confidence_score = confidence
+        message.processed_at = datetime.now()
+    
+    def _extract_progress_and_next_steps(self, text: str) -> Extraction:
         """
         Use OpenAI to extract progress and next steps from message text.
         
@@ -73,45 +367,251 @@ class MessageProcessor:
         Returns:
             Tuple of (progress, next_steps, confidence_score)
         """
-        prompt = self._build_extraction_prompt(text)
+        cached = self.cache.get(self._cache_key(text))
+        if cached is not None:
+            return cached
+        
+        if not self._quick_classify(text):
+            return _NO_EXTRACTION
         
         try:
-            response = openai.chat.completions.create(
-                model=self.settings.openai_model,
-                messages=[
-                    {"role": "system", "content": self._get_system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=500
-            )
-            result = response.choices[0].message.content if response.choices and response.choices[0].message and hasattr(response.choices[0].message, 'content') else None
+            response = self._create_completion(self._extraction_request(text))
+            extraction = self._handle_extraction_response(response)
+            self._cache_store(text, extraction)
+            return extraction
+        except Exception as e:
+            self.logger.error(f"OpenAI API error: {e}")
+            return None, None, 0.0
+    
+    async def _aextract_progress_and_next_steps(self, client: openai.AsyncOpenAI, text: str) -> Extraction:
+        """Async counterpart of _extract_progress_and_next_steps."""
+        try:
+            response = await self._acreate_completion(client, self._extraction_request(text))
+            extraction = self._handle_extraction_response(response)
+            self._cache_store(text, extraction)
+            return extraction
+        except Exception as e:
+            self.logger.error(f"OpenAI API error: {e}")
+            return None, None, 0.0
+    
+    def _quick_classify(self, text: str) -> bool:
+        """
+        Ask the cheap classifier model whether a message is worth a full extraction.
+        
+        Args:
+            text: Message text to screen
+            
+        Returns:
+            False only when the classifier answers "no"; True when it answers "yes",
+            is disabled, or fails, so that ambiguous messages are escalated
+        """
+        if not self.settings.openai_classifier_model:
+            return True
+        if self._is_cached_rejection(text):
+            return False
+        
+        try:
+            response = self._create_completion(self._classifier_request([text]))
+            flag = self._parse_classification(response, 1)[0]
+            if not flag:
+                self._cache_rejection(text)
+            return flag
+        except Exception as e:
+            self.logger.warning(f"OpenAI classifier error, escalating message: {e}")
+            return True
+    
+    async def _aclassify_batch(self, client: openai.AsyncOpenAI, semaphore: asyncio.Semaphore,
+                               batch: List[SlackMessage]) -> List[bool]:
+        """
+        Screen a batch of messages with a single classifier request.
+        
+        Args:
+            client: Pooled async OpenAI client
+            semaphore: Semaphore bounding the number of in-flight requests
+            batch: List of SlackMessage objects to screen together
+            
+        Returns:
+            One flag per message, False only where the classifier answered "no"
+        """
+        async with semaphore:
+            try:
+                response = await self._acreate_completion(
+                    client, self._classifier_request([message.text for message in batch])
+                )
+                return self._parse_classification(response, len(batch))
+            except Exception as e:
+                self.logger.warning(f"OpenAI classifier error, escalating {len(batch)} messages: {e}")
+                return [True] * len(batch)
+    
+    async def _aextract_batch(self, client: openai.AsyncOpenAI,
+                              batch: List[SlackMessage]) -> Optional[Dict[int, Extraction]]:
+        """
+        Use OpenAI to extract progress and next steps from a batch of messages.
+        
+        Args:
+            client: Pooled async OpenAI client
+            batch: List of SlackMessage objects to analyze
+            
+        Returns:
+            Mapping of 1-based message id to (progress, next_steps, confidence_score),
+            or None if the request or response parsing failed
+        """
+        try:
+            response = await self._acreate_completion(client, self._batch_request(batch))
+            result = self._response_content(response)
             if result is not None:
-                return self._parse_extraction_result(result)
+                return self._parse_batch_result(result)
             else:
-                self.logger.error("OpenAI API returned no content in response.")
-                return None, None, 0.0
+                self.logger.error("OpenAI API returned no content in batch response.")
+                return None
         except Exception as e:
             self.logger.error(f"OpenAI API error: {e}")
-            return None, None, 0.0
+            return None
     
-    def _get_system_prompt(self) -> str:
-        """Get the system prompt for OpenAI."""
-        return """You are an expert at analyzing workplace communication messages to extract progress updates and next steps. 
-
-Your task is to:
-1. Identify any progress or accomplishments mentioned in the message
-2. Identify any next steps, plans, or future actions mentioned
-3. Provide a confidence score (0-1) for your extraction
-
-Return your response in the following JSON format:
-{
-    "progress": "extracted progress information or null if none found",
-    "next_steps": "extracted next steps information or null if none found",
-    "confidence": 0.85
-}
-
-Be concise and focus on the key information. If no clear progress or next steps are mentioned, return null for those fields."""
+    def _create_completion(self, request: Dict[str, Any]) -> Any:
+        """Send a chat completion, retrying once without JSON mode if the model rejects it."""
+        request = self._without_unsupported_json_mode(request)
+        try:
+            return self.client.chat.completions.create(**request)
+        except openai.BadRequestError as e:
+            if not self._disable_json_mode(request, e):
+                raise
+        return self.client.chat.completions.create(**self._without_unsupported_json_mode(request))
+    
+    async def _acreate_completion(self, client: openai.AsyncOpenAI, request: Dict[str, Any]) -> Any:
+        """Async counterpart of _create_completion."""
+        request = self._without_unsupported_json_mode(request)
+        try:
+            return await client.chat.completions.create(**request)
+        except openai.BadRequestError as e:
+            if not self._disable_json_mode(request, e):
+                raise
+        return await client.chat.completions.create(**self._without_unsupported_json_mode(request))
+    
+    def _without_unsupported_json_mode(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop response_format from requests to models known not to support JSON mode."""
+        if request['model'] in self._no_json_mode:
+            return {key: value for key, value in request.items() if key != 'response_format'}
+        return request
+    
+    def _disable_json_mode(self, request: Dict[str, Any], error: openai.BadRequestError) -> bool:
+        """
+        Remember a model that rejected JSON mode.
+        
+        Returns:
+            True if the request used JSON mode and the error is about it, so it should
+            be retried without response_format
+        """
+        if 'response_format' not in request or 'response_format' not in str(error):
+            return False
+        if request['model'] not in self._no_json_mode:
+            self.logger.warning(f"{request['model']} does not support JSON mode, sending requests without it")
+            self._no_json_mode.add(request['model'])
+        return True
+    
+    def _cache_key(self, text: str) -> str:
+        """Build the response cache key for a message text."""
+        return hashlib.sha256(f"{self.settings.openai_model}|{SYSTEM_PROMPT_VERSION}|{text}".encode('utf-8')).hexdigest()
+    
+    def _cache_store(self, text: str, extraction: Extraction):
+        """Cache an extraction, skipping the (None, None, 0.0) failure result."""
+        if extraction != _NO_EXTRACTION:
+            self.cache[self._cache_key(text)] = extraction
+    
+    def _classifier_cache_key(self, text: str) -> str:
+        """Build the cache key for a classifier rejection, separate from extraction keys."""
+        return hashlib.sha256(
+            f"classifier|{self.settings.openai_classifier_model}|{CLASSIFIER_PROMPT_VERSION}|{text}".encode('utf-8')
+        ).hexdigest()
+    
+    def _is_cached_rejection(self, text: str) -> bool:
+        """Whether the current classifier model and prompt already rejected this text."""
+        return self.cache.get(self._classifier_cache_key(text)) is False
+    
+    def _cache_rejection(self, text: str):
+        """Remember that the classifier answered "no" for this text."""
+        self.cache[self._classifier_cache_key(text)] = False
+    
+    def _extraction_request(self, text: str) -> Dict[str, Any]:
+        """Build the chat completion arguments for a single message."""
+        return {
+            'model': self.settings.openai_model,
+            'messages': [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": self._build_extraction_prompt(text)}
+            ],
+            'response_format': {"type": "json_object"},
+            'temperature': 0.3,
+            'max_tokens': 500
+        }
+    
+    def _classifier_request(self, texts: List[str]) -> Dict[str, Any]:
+        """Build the chat completion arguments for the yes/no classifier."""
+        return {
+            'model': self.settings.openai_classifier_model,
+            'messages': [
+                {"role": "system", "content": CLASSIFIER_PROMPT},
+                {"role": "user", "content": self._number_texts(texts)}
+            ],
+            'response_format': {"type": "json_object"},
+            'temperature': 0,
+            'max_tokens': min(4096, 20 + 15 * len(texts))
+        }
+    
+    def _batch_request(self, batch: List[SlackMessage]) -> Dict[str, Any]:
+        """Build the chat completion arguments for a batch of messages."""
+        return {
+            'model': self.settings.openai_model,
+            'messages': [
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": self._build_batch_prompt(batch)}
+            ],
+            'response_format': {"type": "json_object"},
+            'temperature': 0.3,
+            'max_tokens': min(4096, 500 * len(batch))
+        }
+    
+    def _response_content(self, response: Any) -> Optional[str]:
+        """Return the text content of a chat completion, if any."""
+        content = response.choices[0].message.content if response.choices and response.choices[0].message and hasattr(response.choices[0].message, 'content') else None
+        if content is None:
+            return None
+        
+        # Without JSON mode the model may wrap its JSON in a markdown fence
+        match = _CODE_FENCE_RE.match(content)
+        return match.group(1) if match else content
+    
+    def _parse_classification(self, response: Any, count: int) -> List[bool]:
+        """
+        Read batched yes/no classifier answers, treating anything but "no" as yes.
+        
+        Messages missing from the reply, or every message if the reply cannot be
+        parsed, are escalated to the extractor.
+        """
+        result = self._response_content(response)
+        if result is None:
+            return [True] * count
+        
+        try:
+            items = orjson.loads(result)['results']
+            rejected = {
+                int(item['id']) for item in items
+                if str(item.get('answer', '')).strip().lower().startswith('no')
+            }
+        except (orjson.JSONDecodeError, ValueError, KeyError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Error parsing classifier response, escalating {count} messages: {e}")
+            return [True] * count
+        
+        return [i not in rejected for i in range(1, count + 1)]
+    
+    def _handle_extraction_response(self, response: Any) -> Extraction:
+        """Parse a single-message chat completion into an extraction tuple."""
+        result = self._response_content(response)
+        if result is not None:
+            return self._parse_extraction_result(result)
+        else:
+            self.logger.error("OpenAI API returned no content in response.")
+            return None, None, 0.0
     
     def _build_extraction_prompt(self, text: str) -> str:
         """Build the extraction prompt for a specific message."""
@@ -121,25 +621,60 @@ Message: "{text}"
 
 Please provide your response in the specified JSON format."""
     
-    def _parse_extraction_result(self, result: str) -> Tuple[Optional[str], Optional[str], float]:
+    def _build_batch_prompt(self, messages: List[SlackMessage]) -> str:
+        """Build the extraction prompt for a batch of messages."""
+        return f"""Please analyze each of the following messages and extract any progress updates and next steps:
+
+{self._number_texts([message.text for message in messages])}
+
+Please provide your response in the specified JSON format."""
+    
+    def _number_texts(self, texts: List[str]) -> str:
+        """Render texts as a 1-based numbered list of JSON strings."""
+        return "\n".join(f"{i}. {orjson.dumps(text).decode()}" for i, text in enumerate(texts, 1))
+    
+    def _parse_extraction_result(self, result: str) -> Extraction:
         """Parse the OpenAI response to extract progress, next steps, and confidence."""
         try:
-            # Try to parse as JSON
-            parsed = json.loads(result)
+            # JSON mode rules out prose; this can still fail on a reply truncated at
+            # max_tokens, a mistyped field, or a model that runs without JSON mode
+            parsed = orjson.loads(result)
+            return self._parse_extraction_fields(parsed)
             
-            progress = parsed.get('progress')
-            next_steps = parsed.get('next_steps')
-            confidence = float(parsed.get('confidence', 0.0))
-            
-            # Convert "null" strings to None
-            if progress == "null":
-                progress = None
-            if next_steps == "null":
-                next_steps = None
-            
-            return progress, next_steps, confidence
-            
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+        except (orjson.JSONDecodeError, ValueError, KeyError, TypeError, AttributeError) as e:
             self.logger.error(f"Error parsing OpenAI response: {e}")
             self.logger.debug(f"Response was: {result}")
             return None, None, 0.0
+    
+    def _parse_batch_result(self, result: str) -> Optional[Dict[int, Extraction]]:
+        """Parse a batched OpenAI response into a mapping of message id to extraction."""
+        try:
+            parsed = orjson.loads(result)
+            items = parsed['results']
+            if not isinstance(items, list):
+                raise ValueError("Expected a JSON array of results")
+            
+        except (orjson.JSONDecodeError, ValueError, KeyError, TypeError, AttributeError) as e:
+            self.logger.error(f"Error parsing batched OpenAI response: {e}")
+            self.logger.debug(f"Response was: {result}")
+            return None
+        
+        # A malformed item is dropped on its own, so only that message is re-requested
+        results = {}
+        for item in items:
+            try:
+                results[int(item['id'])] = self._parse_extraction_fields(item)
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                self.logger.warning(f"Skipping malformed item in batched OpenAI response: {e}")
+                self.logger.debug(f"Item was: {item}")
+        
+        return results
+    
+    def _parse_extraction_fields(self, parsed: Dict[str, Any]) -> Extraction:
+        """Pull progress, next steps, and confidence out of a parsed JSON object."""
+        progress = parsed.get('progress')
+        next_steps = parsed.get('next_steps')
+        # A null confidence is treated as no confidence rather than a parse error
+        confidence = float(parsed.get('confidence') or 0.0)
+        
+        return progress, next_steps, confidence
@@ -4,13 +4,13 @@ from datetime import datetime
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackMessage:
     """Represents a Slack message with extracted progress and next steps."""
     
     user_id: str
     username: str
-    timestamp: datetime
+    ts_raw: str  # Slack's epoch "ts" string, converted to a datetime only on access
     text: str
     channel_id: str
     thread_ts: Optional[str] = None
@@ -23,6 +23,11 @@ class SlackMessage:
     processed_at: Optional[datetime] = None
     confidence_score: Optional[float] = None
     
+    @property
+    def timestamp(self) -> datetime:
+        """When the message was posted, as a local datetime."""
+        return datetime.fromtimestamp(float(self.ts_raw))
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert message to dictionary for JSON serialization."""
         return {
@@ -39,7 +44,7 @@ class SlackMessage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of processing messages."""
     
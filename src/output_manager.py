@@ -1,12 +1,16 @@
 from typing import List, Optional
-import json
 import csv
 from datetime import datetime
 from pathlib import Path
 import logging
+import orjson
 from src.models import SlackMessage, ProcessingResult
 
 
+# Output files are written in large chunks to keep syscall counts low on big result sets
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
 class OutputManager:
     """Handles output formatting and file writing."""
     
@@ -38,11 +42,28 @@ class OutputManager:
             raise ValueError(f"Unsupported format: {format}")
     
     def _save_as_json(self, result: ProcessingResult, filename: str) -> str:
-        """Save results as JSON file."""
+        """
+        Save results as JSON file.
+        
+        The envelope is written by hand and each message is serialized as it is
+        written, so the full list of message dicts is never held in memory.
+        """
         filepath = self.output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(b'{\n')
+            f.write(b'  "total_messages": %s,\n' % orjson.dumps(result.total_messages))
+            f.write(b'  "processed_messages": %s,\n' % orjson.dumps(result.processed_messages))
+            f.write(b'  "failed_messages": %s,\n' % orjson.dumps(result.failed_messages))
+            f.write(b'  "results": [')
+            
+            for i, message in enumerate(result.results):
+                if i:
+                    f.write(b',')
+                f.write(b'\n    ')
+                f.write(orjson.dumps(message.to_dict()))
+            
+            f.write(b'\n  ]\n}\n' if result.results else b']\n}\n')
         
         self.logger.info(f"Results saved to {filepath}")
         return str(filepath)
@@ -56,7 +77,7 @@ class OutputManager:
             'thread_ts', 'progress', 'next_steps', 'processed_at', 'confidence_score'
         ]
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             
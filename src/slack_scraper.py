@@ -1,12 +1,19 @@
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Set, Tuple
 import logging
+import time
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from src.models import SlackMessage
 from src.config import Settings
 
 
+# Largest page size Slack allows for conversations.history
+HISTORY_PAGE_LIMIT = 1000
+
+# Seconds a fetched channel history stays fresh for reuse
+HISTORY_CACHE_TTL = 60.0
+
+
 class SlackScraper:
     """Handles Slack API interactions and message scraping."""
     
@@ -14,11 +21,23 @@ class SlackScraper:
         self.settings = settings
         self.client = WebClient(token=settings.slack_bot_token)
         self.logger = logging.getLogger(__name__)
+        
+        # user_id -> username directory, filled in bulk by _ensure_user_cache
+        self._user_cache: Dict[str, str] = {}
+        self._user_cache_loaded = False
+        
+        # (fetched_at, limit, raw message dicts) from the most recent history fetch
+        self._history_cache: Optional[Tuple[float, int, List[Dict[str, Any]]]] = None
     
     def get_channel_messages(self, limit: Optional[int] = None) -> List[SlackMessage]:
         """
         Retrieve messages from the specified Slack channel.
         
+        The raw history is reused for HISTORY_CACHE_TTL seconds when a later call
+        asks for no more messages than were fetched. Fresh SlackMessage objects are
+        built from the first `limit` raw messages on every call, so cached and
+        uncached calls return the same messages.
+        
         Args:
             limit: Maximum number of messages to retrieve
             
@@ -27,20 +46,37 @@ class SlackScraper:
         """
         limit = limit or self.settings.max_messages
         messages = []
+        channel_id = self.settings.slack_channel_id
         
         try:
-            # Get channel history
-            response = self.client.conversations_history(
-                channel=self.settings.slack_channel_id,
-                limit=limit
-            )
+            messages_data = self._get_cached_history(limit)
+            if messages_data is not None:
+                self.logger.info(f"Reusing {len(messages_data)} cached raw messages from Slack")
+            else:
+                # Get channel history, following cursors until `limit` messages are fetched
+                messages_data = []
+                cursor = None
+                while len(messages_data) < limit:
+                    response = self.client.conversations_history(
+                        channel=channel_id,
+                        limit=min(HISTORY_PAGE_LIMIT, limit - len(messages_data)),
+                        cursor=cursor
+                    )
+                    messages_data.extend(response.get('messages') or [])
+                    
+                    cursor = (response.get('response_metadata') or {}).get('next_cursor')
+                    if not response.get('has_more') or not cursor:
+                        break
+                
+                self._history_cache = (time.monotonic(), limit, messages_data)
             
-            messages_data = response.get('messages')
             if not messages_data:
                 return messages
             
-            # Get user information for username mapping
-            user_cache = {}
+            # Get user information for username mapping; users whose lookup fails are
+            # tried once per call rather than once per message
+            resolve_username = self._resolve_username
+            failed_lookups: Set[str] = set()
             
             for msg in messages_data:
                 # Skip bot messages and system messages
@@ -51,23 +87,13 @@ class SlackScraper:
                 if not user_id:
                     continue
                 
-                # Get username if not cached
-                if user_id not in user_cache:
-                    try:
-                        user_info = self.client.users_info(user=user_id)
-                        user_obj = user_info.get('user') if user_info else None
-                        user_cache[user_id] = user_obj.get('name') if user_obj and user_obj.get('name') else f"user_{user_id}"
-                    except SlackApiError as e:
-                        self.logger.warning(f"Could not get user info for {user_id}: {e}")
-                        user_cache[user_id] = f"user_{user_id}"
-                
                 # Create SlackMessage object
                 message = SlackMessage(
                     user_id=user_id,
-                    username=user_cache[user_id],
-                    timestamp=datetime.fromtimestamp(float(msg['ts'])),
+                    username=resolve_username(user_id, failed_lookups),
+                    ts_raw=msg['ts'],
                     text=msg.get('text', ''),
-                    channel_id=self.settings.slack_channel_id,
+                    channel_id=channel_id,
                     thread_ts=msg.get('thread_ts')
                 )
                 
@@ -80,10 +106,80 @@ class SlackScraper:
         self.logger.info(f"Retrieved {len(messages)} messages from Slack")
         return messages
     
+    def _get_cached_history(self, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the first `limit` cached raw messages if they are fresh and cover `limit`."""
+        if self._history_cache is None:
+            return None
+        
+        fetched_at, fetched_limit, messages_data = self._history_cache
+        if fetched_limit < limit or time.monotonic() - fetched_at > HISTORY_CACHE_TTL:
+            return None
+        
+        return messages_data[:limit]
+    
+    def _ensure_user_cache(self):
+        """Populate the username cache from a single paginated users.list scan."""
+        if self._user_cache_loaded:
+            return
+        self._user_cache_loaded = True
+        
+        cursor = None
+        try:
+            while True:
+                response = self.client.users_list(limit=1000, cursor=cursor)
+                for member in response.get('members') or []:
+                    if member.get('id') and member.get('name'):
+                        self._user_cache[member['id']] = member['name']
+                
+                cursor = (response.get('response_metadata') or {}).get('next_cursor')
+                if not cursor:
+                    break
+        except SlackApiError as e:
+            self.logger.warning(f"Could not list workspace users, falling back to per-user lookups: {e}")
+        
+        self.logger.debug(f"Cached {len(self._user_cache)} usernames")
+    
+    def _resolve_username(self, user_id: str, failed: Optional[Set[str]] = None) -> str:
+        """
+        Map a user ID to a username via the per-scraper username cache.
+        
+        Uses the bulk users.list directory and falls back to users.info for
+        users missing from it, e.g. accounts created after it was fetched.
+        Successful users.info lookups are added to the cache; errors return a
+        placeholder without caching it, so a later scrape retries.
+        
+        Args:
+            user_id: Slack user ID to resolve
+            failed: User IDs whose lookup already failed during the current scrape;
+                they get the placeholder without another users.info call, and new
+                failures are added
+        """
+        self._ensure_user_cache()
+        username = self._user_cache.get(user_id)
+        if username is not None:
+            return username
+        if failed is not None and user_id in failed:
+            return f"user_{user_id}"
+        
+        try:
+            user_info = self.client.users_info(user=user_id)
+            user_obj = user_info.get('user') if user_info else None
+            username = user_obj.get('name') if user_obj and user_obj.get('name') else f"user_{user_id}"
+        except SlackApiError as e:
+            self.logger.warning(f"Could not get user info for {user_id}: {e}")
+            if failed is not None:
+                failed.add(user_id)
+            return f"user_{user_id}"
+        
+        self._user_cache[user_id] = username
+        return username
+    
     def get_user_messages(self, user_id: str, limit: Optional[int] = None) -> List[SlackMessage]:
         """
         Get messages from a specific user.
         
+        Filters the channel history, reusing a recent fetch when one is cached.
+        
         Args:
             user_id: Slack user ID
             limit: Maximum number of messages to retrieve